@@ -13,18 +13,20 @@ from .tibble import *
 from .tidyr import *
 from .misc import *
 
+_conflict_names = _base_conflict_names | _dplyr_conflict_names
+
 __all__ = [key for key in locals() if not key.startswith("_")]
 
 if get_option("allow_conflict_names"):  # noqa: F405
-    __all__.extend(_base_conflict_names | _dplyr_conflict_names)
-    for name in _base_conflict_names | _dplyr_conflict_names:
+    __all__.extend(_conflict_names)
+    for name in _conflict_names:
         locals()[name] = locals()[name + "_"]
 
 
 def __getattr__(name):
     """Even when allow_conflict_names is False, datar.base.sum should be fine
     """
-    if name in _base_conflict_names | _dplyr_conflict_names:
+    if name in _conflict_names:
         import sys
         import ast
         from executing import Source
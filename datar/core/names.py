@@ -3,11 +3,17 @@ import inspect
 import re
 import keyword
 import math
+from collections import Counter
 from numbers import Number
 from typing import Any, Callable, List, Union, Iterable, Tuple
 
 from .utils import logger
 
+# Suffixes added by name repairing, e.g. `x__1` or `__`
+_SUFFIX_REGEX = re.compile(r"(?:(?<!_)_{1,2}\d+|(?<!_)__)+$")
+_REPAIRED_SUFFIX_REGEX = re.compile(r"(?:(?<!_)_{2}\d+|(?<!_)__)+$")
+_NON_WORD_REGEX = re.compile(r"[^\w]")
+
 
 class NameNonUniqueError(ValueError):
     """Error for non-unique names"""
@@ -51,18 +57,16 @@ def _repair_names_unique(
 ) -> List[str]:
     """Make sure names are unique"""
     min_names = _repair_names_minimal(names)
-    neat_names = [
-        re.sub(r"(?:(?<!_)_{1,2}\d+|(?<!_)__)+$", "", name)
-        for name in min_names
-    ]
+    neat_names = [_SUFFIX_REGEX.sub("", name) for name in min_names]
     if callable(sanitizer):
         neat_names = [sanitizer(name) for name in neat_names]
 
+    neat_counts = Counter(neat_names)
     new_names = []
     changed_names = []
     for i, name in enumerate(names):
         neat_name = neat_names[i]
-        if neat_names.count(neat_name) > 1 or neat_name == "":
+        if neat_counts[neat_name] > 1 or neat_name == "":
             neat_name = f"{neat_name}__{i}"
         if neat_name != name:
             changed_names.append((name, neat_name))
@@ -78,7 +82,7 @@ def _repair_names_universal(
 ) -> List[str]:
     """Make sure names are safely to be used as variable or attribute"""
     min_names = _repair_names_minimal(names)
-    neat_names = [re.sub(r"[^\w]", "_", name) for name in min_names]
+    neat_names = [_NON_WORD_REGEX.sub("_", name) for name in min_names]
     new_names = _repair_names_unique(
         neat_names,
         quiet=True,
@@ -100,12 +104,13 @@ def _repair_names_universal(
 
 def _repair_names_check_unique(names: Iterable[str]) -> Iterable[str]:
     """Just check the uniqueness"""
+    counts = Counter(names)
     for name in names:
-        if names.count(name) > 1:
+        if counts[name] > 1:
             raise NameNonUniqueError(f"Names must be unique: {name}")
         if name == "" or _isnan(name):
             raise NameNonUniqueError(f"Names can't be empty: {name}")
-        if re.search(r"(?:(?<!_)_{2}\d+|(?<!_)__)+$", str(name)):
+        if _REPAIRED_SUFFIX_REGEX.search(str(name)):
             raise NameNonUniqueError(
                 f"Names can't be of the form `__` or `_j`: {name}"
             )
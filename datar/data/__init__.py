@@ -16,11 +16,11 @@ def descr_datasets(*names: str):
     Args:
         *names: Names of the datasets to get the information of.
     """
-    return {
-        key: val
-        for key, val in metadata.items()
-        if key in names or not names
-    }
+    if not names:
+        return dict(metadata)
+
+    names = set(names)
+    return {key: val for key, val in metadata.items() if key in names}
 
 
 def add_dataset(name: str, meta: Metadata):